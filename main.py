@@ -3,18 +3,53 @@ FastAPI Mock Server for Palefò API
 Based on api-service.js endpoints
 """
 
-from fastapi import FastAPI, HTTPException, Query, File, UploadFile, Form, Path
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
-from datetime import datetime
+from fastapi import FastAPI, HTTPException, Query, File, UploadFile, Form, Path, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict, EmailStr
+from typing import Optional, List, Dict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import urlsplit
+import httpx
+import orjson
+import bisect
+import itertools
+import operator
 import random
 import uuid
 
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NAIVE_UTC
+    | orjson.OPT_UTC_Z
+)
+
+
+class UTCORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that writes datetimes as UTC with a trailing "Z"."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared client so connections (and TLS sessions) to blob storage are pooled
+    async with httpx.AsyncClient(http2=True, timeout=30) as client:
+        app.state.http_client = client
+        yield
+
+
 # API Metadata for Swagger Documentation
 app = FastAPI(
     title="Palefò Mock API",
+    lifespan=lifespan,
+    default_response_class=UTCORJSONResponse,
     description="""
 ## Palefò API - Haitian Kreyòl Language Learning Platform
 
@@ -80,13 +115,68 @@ Currently no rate limiting is applied to this mock API.
 )
 
 # CORS Configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+class SimpleCORSMiddleware:
+    """
+    Minimal pure-ASGI CORS layer allowing every origin with credentials.
+
+    The request Origin is reflected back (browsers reject "*" on credentialed
+    requests) and preflight requests are answered directly.
+    """
+
+    PREFLIGHT_HEADERS = [
+        (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+        (b"access-control-max-age", b"600"),
+    ]
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = cors_headers + self.PREFLIGHT_HEADERS
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            headers.append((b"content-type", b"text/plain; charset=utf-8"))
+            headers.append((b"content-length", b"2"))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+app.add_middleware(SimpleCORSMiddleware)
+
+# Compress larger JSON payloads (contribution pages, leaderboard)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 # ============================================================================
@@ -94,6 +184,8 @@ app.add_middleware(
 # ============================================================================
 
 class Sentence(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, frozen=True)
+
     id: int
     kreyolText: str
     englishTranslation: str
@@ -103,12 +195,16 @@ class Sentence(BaseModel):
 
 
 class Statistics(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, frozen=True)
+
     totalContributions: int
     uniqueContributors: int
     totalAudioHours: float
 
 
 class Contributor(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, frozen=True)
+
     email: str
     contributionCount: int
     rank: int
@@ -125,11 +221,13 @@ class Contribution(BaseModel):
     region: Optional[str] = None
     isApproved: bool
     rejectionReason: Optional[str] = None
-    createdAt: str
-    updatedAt: str
+    createdAt: datetime
+    updatedAt: datetime
 
 
 class ContributionList(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, frozen=True)
+
     items: List[Contribution]
     page: int
     pageSize: int
@@ -143,6 +241,8 @@ class ModerationRequest(BaseModel):
 
 
 class AIPhrase(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, frozen=True)
+
     phrase: str
     englishTranslation: str
     category: Optional[str] = None
@@ -154,7 +254,7 @@ class AIPhrase(BaseModel):
 # Mock Data
 # ============================================================================
 
-MOCK_SENTENCES = [
+MOCK_SENTENCES = (
     {
         "id": 1,
         "kreyolText": "Bonjou, kijan ou ye?",
@@ -476,25 +576,67 @@ MOCK_SENTENCES = [
         "audioUrl": "https://example.blob.core.windows.net/audio/40.mp3"
     },
 
-]
+)
+
+
+def _build_sentence_indexes(sentences):
+    """Index sentences by category and by difficulty level in a single pass."""
+    by_category: Dict[str, List[dict]] = {}
+    by_difficulty: Dict[int, List[dict]] = {}
+    for sentence in sentences:
+        by_category.setdefault(sentence.get("category"), []).append(sentence)
+        by_difficulty.setdefault(sentence["difficultyLevel"], []).append(sentence)
+    return by_category, by_difficulty
+
+
+# Sentence indexes so category/difficulty lookups don't rescan MOCK_SENTENCES.
+# Rebuild them with _build_sentence_indexes() if the sentence source changes.
+SENTENCES_BY_CATEGORY, SENTENCES_BY_DIFFICULTY = _build_sentence_indexes(MOCK_SENTENCES)
 
+_SEED_TIMESTAMP = datetime(2025, 1, 1, 10, tzinfo=timezone.utc)
+
+# Draw each random column in one call rather than per row. A fixed seed keeps
+# the seeded approvals identical in every process when running several workers.
+_n = len(MOCK_SENTENCES)
+_seed_rng = random.Random(0)
 MOCK_CONTRIBUTIONS = [
     {
         "id": i,
         "kreyolText": sentence["kreyolText"],
         "audioUrl": sentence["audioUrl"],
         "email": f"user{i}@example.com",
-        "gender": random.choice(["male", "female", "other"]),
-        "region": random.choice(["Port-au-Prince", "Cap-Haïtien", "Les Cayes", "Gonaïves"]),
-        "isApproved": random.choice([True, False]),
-        "rejectionReason": None if random.choice([True, False]) else "Audio quality issue",
-        "createdAt": "2025-01-01T10:00:00Z",
-        "updatedAt": "2025-01-01T10:00:00Z"
+        "gender": gender,
+        "region": region,
+        "isApproved": approved,
+        "rejectionReason": reason,
+        "createdAt": _SEED_TIMESTAMP,
+        "updatedAt": _SEED_TIMESTAMP
     }
-    for i, sentence in enumerate(MOCK_SENTENCES, start=1)
+    for i, (sentence, gender, region, approved, reason) in enumerate(
+        zip(
+            MOCK_SENTENCES,
+            _seed_rng.choices(["male", "female", "other"], k=_n),
+            _seed_rng.choices(["Port-au-Prince", "Cap-Haïtien", "Les Cayes", "Gonaïves"], k=_n),
+            _seed_rng.choices([True, False], k=_n),
+            _seed_rng.choices([None, "Audio quality issue"], k=_n),
+        ),
+        start=1,
+    )
 ]
+del _n, _seed_rng
+
+# id -> contribution; the list above is kept for pagination order
+CONTRIBUTIONS_BY_ID: Dict[int, dict] = {c["id"]: c for c in MOCK_CONTRIBUTIONS}
+
+# Ids for new submissions, independent of the list length
+_next_contribution_id = itertools.count(start=len(MOCK_CONTRIBUTIONS) + 1)
 
-MOCK_CONTRIBUTORS = [
+# Approved-only view in id order, maintained by moderate_contribution
+APPROVED_CONTRIBUTIONS: List[dict] = [c for c in MOCK_CONTRIBUTIONS if c["isApproved"]]
+_contribution_id = operator.itemgetter("id")
+
+# Kept in rank order: the leaderboard serves this tuple as-is
+MOCK_CONTRIBUTORS = (
     {"email": "contributor1@example.com", "contributionCount": 15000, "rank": 1, "gender": "female", "region": "Port-au-Prince"},
     {"email": "contributor2@example.com", "contributionCount": 12000, "rank": 2, "gender": "male", "region": "Cap-Haïtien"},
     {"email": "contributor3@example.com", "contributionCount": 8500, "rank": 3, "gender": "female", "region": "Les Cayes"},
@@ -505,15 +647,49 @@ MOCK_CONTRIBUTORS = [
     {"email": "contributor8@example.com", "contributionCount": 2200, "rank": 8, "gender": "female", "region": "Jérémie"},
     {"email": "contributor9@example.com", "contributionCount": 1900, "rank": 9, "gender": "male", "region": "Hinche"},
     {"email": "contributor10@example.com", "contributionCount": 1500, "rank": 10, "gender": "female", "region": "Port-de-Paix"},
-]
+)
+
+
+def _compute_statistics() -> dict:
+    """Build the /api/statistics payload from MOCK_CONTRIBUTORS."""
+    total_contributions = sum(c["contributionCount"] for c in MOCK_CONTRIBUTORS)
+    return {
+        "totalContributions": total_contributions,
+        "uniqueContributors": len(MOCK_CONTRIBUTORS),
+        # Assume average contribution is 3 seconds
+        "totalAudioHours": round((total_contributions * 3) / 3600, 2),
+    }
+
+
+# MOCK_CONTRIBUTORS is read-only, so the statistics payload is computed and
+# serialized once
+_STATS_CACHE = orjson.dumps(_compute_statistics())
 
 
 # ============================================================================
 # Endpoints
 # ============================================================================
 
+# Root payload is static; serialize it once at import
+_ROOT_PAYLOAD = orjson.dumps({
+    "message": "Welcome to Palefò Mock API",
+    "version": app.version,
+    "documentation": {
+        "swagger": "/docs",
+        "redoc": "/redoc"
+    },
+    "endpoints": {
+        "sentences": "/api/sentences/*",
+        "contributions": "/api/contributions",
+        "statistics": "/api/statistics",
+        "contributors": "/api/contributors/top",
+        "ai": "/api/ai/*"
+    }
+})
+
+
 @app.get("/", tags=["root"])
-def read_root():
+async def read_root():
     """
     # Welcome to Palefò Mock API
 
@@ -523,31 +699,39 @@ def read_root():
     - Swagger UI: `/docs`
     - ReDoc: `/redoc`
     """
-    return {
-        "message": "Welcome to Palefò Mock API",
-        "version": "1.0.0",
-        "documentation": {
-            "swagger": "/docs",
-            "redoc": "/redoc"
-        },
-        "endpoints": {
-            "sentences": "/api/sentences/*",
-            "contributions": "/api/contributions",
-            "statistics": "/api/statistics",
-            "contributors": "/api/contributors/top",
-            "ai": "/api/ai/*"
-        }
-    }
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json")
 
 
 # ============================================================================
 # Sentences Endpoints
 # ============================================================================
 
+# Comma-separated list of integer ids, whitespace allowed around each id;
+# enforced by FastAPI so malformed input gets a 422 before the handler runs.
+# Ids are capped at 9 digits so every accepted value is safe to pass to int().
+_EXCLUDE_IDS_PATTERN = r"^(?:\s*\d{1,9}(?:\s*,\s*\d{1,9})*\s*)?$"
+
+
+def _sample_sentences(pool, count: int) -> List[dict]:
+    """Return up to `count` distinct random sentences from `pool`."""
+    if not pool:
+        return []
+
+    # count=1 is the default and the most common request
+    if count == 1:
+        return [random.choice(pool)]
+
+    return random.sample(pool, min(count, len(pool)))
+
+
 @app.get("/api/sentences/random", tags=["sentences"])
-def get_random_sentences(
+async def get_random_sentences(
     count: int = Query(1, ge=1, le=50, description="Number of random sentences to retrieve"),
-    excludeIds: Optional[str] = Query(None, description="Comma-separated list of sentence IDs to exclude")
+    excludeIds: Optional[str] = Query(
+        None,
+        pattern=_EXCLUDE_IDS_PATTERN,
+        description="Comma-separated list of sentence IDs to exclude"
+    )
 ):
     """
     ## Get Random Sentences
@@ -560,24 +744,23 @@ def get_random_sentences(
 
     **Returns:** Array of sentence objects with Kreyòl text, English translation, and audio URLs
     """
-    exclude_list = []
-    if excludeIds:
-        try:
-            exclude_list = [int(id.strip()) for id in excludeIds.split(",")]
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid excludeIds format")
+    # Common case: nothing to exclude, sample straight from the full list
+    if not excludeIds:
+        return UTCORJSONResponse(content=_sample_sentences(MOCK_SENTENCES, count))
 
-    available_sentences = [s for s in MOCK_SENTENCES if s["id"] not in exclude_list]
+    exclude = frozenset(map(int, excludeIds.split(",")))
 
-    if not available_sentences:
-        return []
+    available_sentences = [s for s in MOCK_SENTENCES if s["id"] not in exclude]
+    return UTCORJSONResponse(content=_sample_sentences(available_sentences, count))
 
-    selected_count = min(count, len(available_sentences))
-    return random.sample(available_sentences, selected_count)
+
+def _lookup_by_category(category: str, count: int) -> List[dict]:
+    """Return up to `count` random sentences from the given category."""
+    return _sample_sentences(SENTENCES_BY_CATEGORY.get(category, ()), count)
 
 
 @app.get("/api/sentences/category/{category}", tags=["sentences"])
-def get_sentences_by_category(
+async def get_sentences_by_category(
     category: str = Path(..., description="Category name (e.g., molou, general, proverb, greetings, food, education)"),
     count: int = Query(1, ge=1, le=50, description="Number of sentences to retrieve"),
     userId: Optional[int] = Query(None, description="User ID for tracking (optional)")
@@ -596,17 +779,11 @@ def get_sentences_by_category(
 
     **Returns:** Array of sentences matching the specified category
     """
-    filtered_sentences = [s for s in MOCK_SENTENCES if s.get("category") == category]
-
-    if not filtered_sentences:
-        return []
-
-    selected_count = min(count, len(filtered_sentences))
-    return random.sample(filtered_sentences, selected_count)
+    return UTCORJSONResponse(content=_lookup_by_category(category, count))
 
 
 @app.get("/api/sentences/category-simple/{category}", tags=["sentences"])
-def get_sentences_by_category_simple(
+async def get_sentences_by_category_simple(
     category: str = Path(..., description="Category name"),
     count: int = Query(1, ge=1, le=50, description="Number of sentences to retrieve")
 ):
@@ -617,11 +794,11 @@ def get_sentences_by_category_simple(
     Provides the same functionality as the standard category endpoint.
     """
     # Same implementation as category endpoint for mock purposes
-    return get_sentences_by_category(category, count)
+    return UTCORJSONResponse(content=_lookup_by_category(category, count))
 
 
 @app.get("/api/sentences/difficulty/{level}", tags=["sentences"])
-def get_sentences_by_difficulty(
+async def get_sentences_by_difficulty(
     level: int = Path(..., ge=1, le=5, description="Difficulty level from 1 (easiest) to 5 (hardest)"),
     count: int = Query(1, ge=1, le=50, description="Number of sentences to retrieve")
 ):
@@ -637,17 +814,11 @@ def get_sentences_by_difficulty(
     - **4**: Advanced - Complex grammar and vocabulary
     - **5**: Expert - Specialized or technical language
     """
-    filtered_sentences = [s for s in MOCK_SENTENCES if s["difficultyLevel"] == level]
-
-    if not filtered_sentences:
-        return []
-
-    selected_count = min(count, len(filtered_sentences))
-    return random.sample(filtered_sentences, selected_count)
+    return UTCORJSONResponse(content=_sample_sentences(SENTENCES_BY_DIFFICULTY.get(level, ()), count))
 
 
 @app.get("/api/sentences/proverb", tags=["sentences"])
-def get_proverb_sentences(
+async def get_proverb_sentences(
     count: int = Query(1, ge=1, le=50, description="Number of proverb sentences to retrieve")
 ):
     """
@@ -664,13 +835,7 @@ def get_proverb_sentences(
     - "Imilyasyon se lanfe" - Humiliation is hell
     - "Gwo bounda pa vle di la sante" - Big buttocks do not mean health
     """
-    proverb_sentences = [s for s in MOCK_SENTENCES if s.get("category") == "proverb"]
-
-    if not proverb_sentences:
-        return []
-
-    selected_count = min(count, len(proverb_sentences))
-    return random.sample(proverb_sentences, selected_count)
+    return UTCORJSONResponse(content=_lookup_by_category("proverb", count))
 
 
 # ============================================================================
@@ -678,7 +843,7 @@ def get_proverb_sentences(
 # ============================================================================
 
 @app.get("/api/Sentences/category/{category}", tags=["sentences"])
-def get_sentences_by_category_with_user(
+async def get_sentences_by_category_with_user(
     category: str = Path(..., description="Category name (e.g., molou, general, proverb, greetings, food)"),
     count: int = Query(1, ge=1, le=50, description="Number of sentences to retrieve"),
     userId: Optional[int] = Query(None, description="User ID for tracking (optional)")
@@ -697,13 +862,7 @@ def get_sentences_by_category_with_user(
 
     **Returns:** Array of sentences matching the specified category
     """
-    filtered_sentences = [s for s in MOCK_SENTENCES if s.get("category") == category]
-
-    if not filtered_sentences:
-        return []
-
-    selected_count = min(count, len(filtered_sentences))
-    return random.sample(filtered_sentences, selected_count)
+    return UTCORJSONResponse(content=_lookup_by_category(category, count))
 
 
 # ============================================================================
@@ -711,7 +870,7 @@ def get_sentences_by_category_with_user(
 # ============================================================================
 
 @app.get("/api/statistics", response_model=Statistics, tags=["statistics"])
-def get_statistics():
+async def get_statistics():
     """
     ## Get Platform Statistics
 
@@ -724,24 +883,25 @@ def get_statistics():
 
     These statistics help track the platform's growth and community engagement.
     """
-    total_contributions = sum(c["contributionCount"] for c in MOCK_CONTRIBUTORS)
-    unique_contributors = len(MOCK_CONTRIBUTORS)
-    # Assume average contribution is 3 seconds
-    total_audio_hours = round((total_contributions * 3) / 3600, 2)
-
-    return {
-        "totalContributions": total_contributions,
-        "uniqueContributors": unique_contributors,
-        "totalAudioHours": total_audio_hours
-    }
+    return Response(content=_STATS_CACHE, media_type="application/json")
 
 
 # ============================================================================
 # Contributors Endpoint
 # ============================================================================
 
+# The default limit covers the whole leaderboard, so keep that payload pre-encoded
+_CONTRIBUTORS_JSON_FULL = orjson.dumps(MOCK_CONTRIBUTORS)
+
+
+@lru_cache(maxsize=16)
+def _top_contributors_payload(limit: int) -> bytes:
+    """Serialized JSON for the top `limit` contributors."""
+    return orjson.dumps(MOCK_CONTRIBUTORS[:limit])
+
+
 @app.get("/api/contributors/top", response_model=List[Contributor], tags=["contributors"])
-def get_top_contributors(
+async def get_top_contributors(
     limit: int = Query(10, ge=1, le=100, description="Number of top contributors to retrieve")
 ):
     """
@@ -757,14 +917,25 @@ def get_top_contributors(
 
     **Returns:** List of contributors with their rank, email, and contribution count
     """
-    return MOCK_CONTRIBUTORS[:limit]
+    if limit >= len(MOCK_CONTRIBUTORS):
+        return Response(content=_CONTRIBUTORS_JSON_FULL, media_type="application/json")
+    return Response(content=_top_contributors_payload(limit), media_type="application/json")
 
 
 # ============================================================================
 # Contributions Endpoints
 # ============================================================================
 
-@app.post("/api/contributions", tags=["contributions"])
+def _utc_now() -> datetime:
+    """Current UTC time at second precision, matching the seeded timestamps."""
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+_ALLOWED_AUDIO_EXTS = frozenset({"mp3", "wav", "webm", "m4a"})
+_ALLOWED_EXTS_MSG = "Invalid file type. Allowed: " + ", ".join("." + e for e in sorted(_ALLOWED_AUDIO_EXTS))
+
+
+@app.post("/api/contributions", response_model=Contribution, tags=["contributions"])
 async def submit_contribution(
     KreyòlText: str = Form(..., description="The Haitian Kreyòl text to be recorded"),
     AudioFile: UploadFile = File(..., description="Audio recording file (mp3, wav, webm, or m4a)"),
@@ -793,17 +964,14 @@ async def submit_contribution(
         raise HTTPException(status_code=400, detail="Audio file is required")
 
     # Validate file type
-    allowed_extensions = [".mp3", ".wav", ".webm", ".m4a"]
-    file_extension = "." + AudioFile.filename.split(".")[-1].lower()
-    if file_extension not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
-        )
+    ext = AudioFile.filename.rpartition(".")[2].lower()
+    if ext not in _ALLOWED_AUDIO_EXTS:
+        raise HTTPException(status_code=400, detail=_ALLOWED_EXTS_MSG)
 
     # Create mock contribution
-    new_id = len(MOCK_CONTRIBUTIONS) + 1
-    mock_audio_url = f"https://example.blob.core.windows.net/audio/{uuid.uuid4()}.{file_extension[1:]}"
+    now = _utc_now()
+    new_id = next(_next_contribution_id)
+    mock_audio_url = f"https://example.blob.core.windows.net/audio/{uuid.uuid4()}.{ext}"
 
     new_contribution = {
         "id": new_id,
@@ -814,17 +982,43 @@ async def submit_contribution(
         "region": Region,
         "isApproved": False,  # Pending approval by default
         "rejectionReason": None,
-        "createdAt": datetime.utcnow().isoformat() + "Z",
-        "updatedAt": datetime.utcnow().isoformat() + "Z"
+        "createdAt": now,
+        "updatedAt": now
     }
 
     MOCK_CONTRIBUTIONS.append(new_contribution)
+    CONTRIBUTIONS_BY_ID[new_id] = new_contribution
+    _contributions_page.cache_clear()
 
     return new_contribution
 
 
+@lru_cache(maxsize=256)
+def _contributions_page(includeUnapproved: bool, page: int, pageSize: int) -> bytes:
+    """Serialized JSON for one contributions page; cleared on every write."""
+    # Pick the source list based on approval status
+    filtered_contributions = MOCK_CONTRIBUTIONS if includeUnapproved else APPROVED_CONTRIBUTIONS
+
+    total_items = len(filtered_contributions)
+    total_pages = (total_items + pageSize - 1) // pageSize
+
+    # Calculate pagination
+    start_idx = (page - 1) * pageSize
+    end_idx = start_idx + pageSize
+
+    items = filtered_contributions[start_idx:end_idx]
+
+    return orjson.dumps({
+        "items": items,
+        "page": page,
+        "pageSize": pageSize,
+        "totalItems": total_items,
+        "totalPages": total_pages
+    }, option=_ORJSON_OPTIONS)
+
+
 @app.get("/api/contributions", response_model=ContributionList, tags=["contributions"])
-def get_contributions(
+async def get_contributions(
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     pageSize: int = Query(20, ge=1, le=100, description="Number of items per page"),
     includeUnapproved: bool = Query(False, description="Include unapproved contributions (admin only)")
@@ -843,32 +1037,12 @@ def get_contributions(
 
     By default, only approved contributions are returned to public users.
     """
-    # Filter contributions based on approval status
-    if includeUnapproved:
-        filtered_contributions = MOCK_CONTRIBUTIONS
-    else:
-        filtered_contributions = [c for c in MOCK_CONTRIBUTIONS if c["isApproved"]]
-
-    total_items = len(filtered_contributions)
-    total_pages = (total_items + pageSize - 1) // pageSize
-
-    # Calculate pagination
-    start_idx = (page - 1) * pageSize
-    end_idx = start_idx + pageSize
-
-    items = filtered_contributions[start_idx:end_idx]
-
-    return {
-        "items": items,
-        "page": page,
-        "pageSize": pageSize,
-        "totalItems": total_items,
-        "totalPages": total_pages
-    }
+    content = _contributions_page(includeUnapproved, page, pageSize)
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/api/contributions/{id}", response_model=Contribution, tags=["contributions"])
-def get_contribution_by_id(
+async def get_contribution_by_id(
     id: int = Path(..., ge=1, description="Unique contribution ID")
 ):
     """
@@ -881,16 +1055,16 @@ def get_contribution_by_id(
 
     **Returns:** Contribution object with all details including audio URL and text
     """
-    contribution = next((c for c in MOCK_CONTRIBUTIONS if c["id"] == id), None)
+    contribution = CONTRIBUTIONS_BY_ID.get(id)
 
     if not contribution:
         raise HTTPException(status_code=404, detail="Contribution not found")
 
-    return contribution
+    return UTCORJSONResponse(content=contribution)
 
 
 @app.patch("/api/contributions/{id}/approval", tags=["contributions"])
-def moderate_contribution(
+async def moderate_contribution(
     id: int = Path(..., ge=1, description="Contribution ID to moderate"),
     moderation: ModerationRequest = None
 ):
@@ -915,7 +1089,7 @@ def moderate_contribution(
 
     **Returns:** Updated contribution object with new approval status
     """
-    contribution = next((c for c in MOCK_CONTRIBUTIONS if c["id"] == id), None)
+    contribution = CONTRIBUTIONS_BY_ID.get(id)
 
     if not contribution:
         raise HTTPException(status_code=404, detail="Contribution not found")
@@ -926,29 +1100,82 @@ def moderate_contribution(
             detail="Rejection reason is required when rejecting a contribution"
         )
 
+    # Keep the approved-only list in sync when the status flips; the list is
+    # ordered by id, so the slot is found by binary search
+    if moderation.approved and not contribution["isApproved"]:
+        bisect.insort(APPROVED_CONTRIBUTIONS, contribution, key=_contribution_id)
+    elif not moderation.approved and contribution["isApproved"]:
+        del APPROVED_CONTRIBUTIONS[bisect.bisect_left(APPROVED_CONTRIBUTIONS, id, key=_contribution_id)]
+
     # Update contribution
     contribution["isApproved"] = moderation.approved
     contribution["rejectionReason"] = moderation.rejectionReason if not moderation.approved else None
-    contribution["updatedAt"] = datetime.utcnow().isoformat() + "Z"
+    contribution["updatedAt"] = _utc_now()
+    _contributions_page.cache_clear()
 
-    return contribution
+    return UTCORJSONResponse(content=contribution)
 
 
 # ============================================================================
 # AI Phrase Generation Endpoints
 # ============================================================================
 
-AI_PHRASES = [
+AI_PHRASES = (
     {"phrase": "Lanmou se pi bèl bagay nan lavi.", "translation": "Love is the most beautiful thing in life.", "category": "emotions", "difficulty": 3},
     {"phrase": "Edikasyon se kle siksè.", "translation": "Education is the key to success.", "category": "education", "difficulty": 2},
     {"phrase": "Fanmi se richès ki pi enpòtan.", "translation": "Family is the most important wealth.", "category": "family", "difficulty": 2},
     {"phrase": "Travay di fè moun rich.", "translation": "Hard work makes people rich.", "category": "work", "difficulty": 2},
     {"phrase": "Respè se baz tout bon relasyon.", "translation": "Respect is the basis of all good relationships.", "category": "society", "difficulty": 3},
-]
+)
+
+# Word counts and lookup indexes are static, so build them once at import
+AI_PHRASES_BY_CATEGORY: Dict[str, List[dict]] = {}
+AI_PHRASES_BY_DIFFICULTY: Dict[int, List[dict]] = {}
+for _phrase in AI_PHRASES:
+    _phrase["wordCount"] = len(_phrase["phrase"].split())
+    AI_PHRASES_BY_CATEGORY.setdefault(_phrase["category"], []).append(_phrase)
+    AI_PHRASES_BY_DIFFICULTY.setdefault(_phrase["difficulty"], []).append(_phrase)
+del _phrase
+
+
+def _random_ai_phrase(
+    category: Optional[str],
+    difficultyLevel: Optional[int],
+    minWords: Optional[int],
+    maxWords: Optional[int]
+) -> dict:
+    """Pick a random AI phrase matching the optional filters."""
+    # Start from the narrowest index available
+    if category:
+        filtered_phrases = AI_PHRASES_BY_CATEGORY.get(category, [])
+    elif difficultyLevel:
+        filtered_phrases = AI_PHRASES_BY_DIFFICULTY.get(difficultyLevel, [])
+    else:
+        filtered_phrases = AI_PHRASES
+
+    # Apply any remaining filters in a single pass
+    if (category and difficultyLevel) or minWords or maxWords:
+        filtered_phrases = [
+            p for p in filtered_phrases
+            if (not difficultyLevel or p["difficulty"] == difficultyLevel) and
+               (not minWords or p["wordCount"] >= minWords) and
+               (not maxWords or p["wordCount"] <= maxWords)
+        ]
+
+    # Fall back to any phrase if nothing matches
+    phrase_data = random.choice(filtered_phrases or AI_PHRASES)
+
+    return {
+        "phrase": phrase_data["phrase"],
+        "englishTranslation": phrase_data["translation"],
+        "category": phrase_data["category"],
+        "difficultyLevel": phrase_data["difficulty"],
+        "wordCount": phrase_data["wordCount"]
+    }
 
 
 @app.get("/api/ai/random-phrase", response_model=AIPhrase, tags=["ai"])
-def get_ai_generated_phrase(
+async def get_ai_generated_phrase(
     category: Optional[str] = Query(None, description="Filter by category (e.g., emotions, education, family)"),
     difficultyLevel: Optional[int] = Query(None, ge=1, le=5, description="Difficulty level (1-5)"),
     minWords: Optional[int] = Query(None, ge=1, description="Minimum number of words"),
@@ -969,41 +1196,11 @@ def get_ai_generated_phrase(
 
     Useful for generating practice content and expanding the learning material.
     """
-    filtered_phrases = AI_PHRASES.copy()
-
-    # Filter by category
-    if category:
-        filtered_phrases = [p for p in filtered_phrases if p["category"] == category]
-
-    # Filter by difficulty
-    if difficultyLevel:
-        filtered_phrases = [p for p in filtered_phrases if p["difficulty"] == difficultyLevel]
-
-    # Filter by word count
-    if minWords or maxWords:
-        filtered_phrases = [
-            p for p in filtered_phrases
-            if (not minWords or len(p["phrase"].split()) >= minWords) and
-               (not maxWords or len(p["phrase"].split()) <= maxWords)
-        ]
-
-    if not filtered_phrases:
-        # Generate a random phrase if no matches
-        phrase_data = random.choice(AI_PHRASES)
-    else:
-        phrase_data = random.choice(filtered_phrases)
-
-    return {
-        "phrase": phrase_data["phrase"],
-        "englishTranslation": phrase_data["translation"],
-        "category": phrase_data["category"],
-        "difficultyLevel": phrase_data["difficulty"],
-        "wordCount": len(phrase_data["phrase"].split())
-    }
+    return UTCORJSONResponse(content=_random_ai_phrase(category, difficultyLevel, minWords, maxWords))
 
 
 @app.get("/api/ai/gemini-phrase", response_model=AIPhrase, tags=["ai"])
-def get_gemini_phrase(
+async def get_gemini_phrase(
     category: Optional[str] = Query(None, description="Filter by category"),
     difficultyLevel: Optional[int] = Query(None, ge=1, le=5, description="Difficulty level (1-5)"),
     minWords: Optional[int] = Query(None, ge=1, description="Minimum number of words"),
@@ -1024,15 +1221,22 @@ def get_gemini_phrase(
     - **maxWords**: Maximum word count
     """
     # For mock purposes, use the same implementation as random-phrase
-    return get_ai_generated_phrase(category, difficultyLevel, minWords, maxWords)
+    return UTCORJSONResponse(content=_random_ai_phrase(category, difficultyLevel, minWords, maxWords))
 
 
 # ============================================================================
 # Proxy Endpoint
 # ============================================================================
 
+_PROXY_HOST_SUFFIX = ".blob.core.windows.net"
+
+# Upstream headers passed back so browsers can size and seek the audio
+_PROXY_RESPONSE_HEADERS = ("content-length", "accept-ranges", "content-range")
+
+
 @app.get("/api/proxy-audio", tags=["proxy"])
-def proxy_audio(
+async def proxy_audio(
+    request: Request,
     url: str = Query(..., description="URL of the audio file to proxy")
 ):
     """
@@ -1045,18 +1249,54 @@ def proxy_audio(
 
     **Purpose:**
     This endpoint helps bypass CORS (Cross-Origin Resource Sharing) restrictions
-    when accessing audio files stored in Azure blob storage or other external services.
+    when accessing audio files stored in Azure blob storage.
 
-    **Note:** In production, this endpoint would fetch and stream the actual audio file.
-    In this mock version, it returns information about the proxy request.
+    **Note:** Only `https` URLs on `*.blob.core.windows.net` are proxied. The audio
+    is streamed through as it arrives rather than buffered in memory.
     """
-    # In a real implementation, this would fetch and stream the audio file
-    # For mock purposes, return the original URL
-    return {
-        "message": "Audio proxy endpoint",
-        "originalUrl": url,
-        "note": "In production, this would stream the audio file"
+    parts = urlsplit(url)
+    if parts.scheme != "https" or not (parts.hostname or "").endswith(_PROXY_HOST_SUFFIX):
+        raise HTTPException(status_code=400, detail="Only Azure blob storage URLs can be proxied")
+
+    # The client is created by the app lifespan
+    client = getattr(request.app.state, "http_client", None)
+    if client is None:
+        raise HTTPException(status_code=503, detail="Audio proxy is not available")
+
+    # Ask for the bytes as stored so Content-Length matches what we stream, and
+    # forward Range so <audio> seeking works through the proxy
+    upstream_headers = {"Accept-Encoding": "identity"}
+    if "range" in request.headers:
+        upstream_headers["Range"] = request.headers["range"]
+
+    try:
+        upstream = await client.send(
+            client.build_request("GET", url, headers=upstream_headers), stream=True
+        )
+    except httpx.HTTPError:
+        raise HTTPException(status_code=502, detail="Failed to fetch audio file")
+
+    if not upstream.is_success:
+        await upstream.aclose()
+        # Redirects are not followed; report anything but 2xx as a bad upstream
+        status_code = upstream.status_code if upstream.is_error else 502
+        raise HTTPException(status_code=status_code, detail="Failed to fetch audio file")
+
+    headers = {
+        name: upstream.headers[name]
+        for name in _PROXY_RESPONSE_HEADERS
+        if name in upstream.headers
     }
+    # Audio doesn't compress; Content-Encoding keeps GZipMiddleware out of the way
+    headers["Content-Encoding"] = "identity"
+
+    return StreamingResponse(
+        upstream.aiter_raw(),
+        status_code=upstream.status_code,
+        media_type=upstream.headers.get("content-type", "audio/mpeg"),
+        headers=headers,
+        background=BackgroundTask(upstream.aclose),
+    )
 
 
 # ============================================================================
@@ -1064,5 +1304,25 @@ def proxy_audio(
 # ============================================================================
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        # uvloop doesn't support Windows
+        loop = "asyncio"
+
+    # The mock data lives in process memory, so each worker would get its own
+    # contributions store (a POST on one worker is a 404 on another). Run a
+    # single worker unless WEB_CONCURRENCY opts in to more.
+    # Import string form is required when running more than one worker
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop=loop,
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+    )